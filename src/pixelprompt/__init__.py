@@ -16,9 +16,13 @@ from .core import (
     RenderConfig,
     RenderedImage,
     estimate_image_tokens,
+    render_code,
+    render_config,
+    render_json,
+    render_prose,
 )
 from .prompts import CONCISE_SUFFIX, image_query, optimize_prompt
-from .utils import estimate_tokens
+from .utils import estimate_tokens, estimate_tokens_batch
 
 __all__ = [
     "PixelPrompt",
@@ -27,7 +31,12 @@ __all__ = [
     "CONTENT_PRESETS",
     "MODEL_PRICING",
     "estimate_image_tokens",
+    "render_prose",
+    "render_json",
+    "render_code",
+    "render_config",
     "estimate_tokens",
+    "estimate_tokens_batch",
     "minify_text",
     "compact_json",
     "optimize_prompt",
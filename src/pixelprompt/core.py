@@ -12,17 +12,22 @@ Key features (from Pixels Beat Tokens research, benchmark v2):
 """
 
 import base64
+import functools
 import io
 import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
 
 from PIL import Image, ImageDraw, ImageFont
 
-# Claude vision token formula (from Anthropic docs, Feb 2026)
-TOKENS_PER_PIXEL_DIVISOR = 750
-MAX_VISION_DIMENSION = 1568
+from .utils import (  # noqa: F401 (re-exported for backwards compatibility)
+    MAX_VISION_DIMENSION,
+    TOKENS_PER_PIXEL_DIVISOR,
+    estimate_image_tokens,
+)
 
 # Pricing ($/MTok) — Feb 2026
 MODEL_PRICING = {
@@ -66,10 +71,120 @@ CONTENT_PRESETS = {
     },
 }
 
+# compact_json and minify_text memoize up to _MEMO_ENTRIES inputs shorter than
+# _MEMO_MAX_CHARS characters. An entry pins the input and its result (at most
+# as long), so each cache holds at most 32 x 64K x 2 characters: 4 MB for ASCII
+# text, 16 MB in the worst case of 4-byte (non-BMP) characters.
+_MEMO_ENTRIES = 32
+_MEMO_MAX_CHARS = 64 * 1024
 
-@dataclass
+# Space runs compact_json would drop, on either the json.dumps or the regex
+# fallback path: next to a structural character, or two or more in a row.
+_JSON_LOOSE_SPACES = ("  ",) + tuple(pair for ch in "{}[],:" for pair in (" " + ch, ch + " "))
+
+# Regex fallback for text json.loads rejects: collapse whitespace runs, then
+# drop the spaces around structural characters
+_JSON_WS_RUN_RE = re.compile(r"\s+")
+_JSON_PUNCT_RE = re.compile(r"\s*([{}:,\[\]])\s*")
+
+
+def _is_compact_json(text: str) -> bool:
+    """Return True if ``text`` is compact ASCII, possibly non-canonical.
+
+    Uses only C-level str scans so large, already-compact payloads skip the
+    parse/serialize round-trip. Whitespace-compact is all it checks: input
+    that json.dumps would still rewrite (escapes such as ``"\\u0041"`` or
+    ``"\\/"``, duplicate keys, number spelling) passes through as-is, and
+    need not even be valid JSON. Conservative about spaces: a string value
+    containing e.g. ``", "`` reports False and takes the normal path.
+    """
+    return (
+        text.isascii()
+        and text.isprintable()  # no tabs/newlines/other control whitespace
+        and not text.startswith(" ")
+        and not text.endswith(" ")
+        and not any(spaces in text for spaces in _JSON_LOOSE_SPACES)
+    )
+
+
+def _compact_json(text: str) -> str:
+    """Uncached parse/serialize path of ``PixelPrompt.compact_json``."""
+    try:
+        parsed = json.loads(text)
+        return json.dumps(parsed, separators=(",", ":"))
+    except (json.JSONDecodeError, ValueError):
+        # Fallback: regex-based compaction
+        result = _JSON_WS_RUN_RE.sub(" ", text)
+        result = _JSON_PUNCT_RE.sub(r"\1", result)
+        return result.strip()
+
+
+_compact_json_cached = functools.lru_cache(maxsize=_MEMO_ENTRIES)(_compact_json)
+
+
+# Minification patterns, compiled once (minify_text runs on every render).
+# Line-start patterns anchor on a literal "\n" rather than (?m)^ so the regex
+# engine can skip ahead to candidate positions; minify_text brackets its input
+# with newlines to make that hold for the first and last line.
+_BOLD_RE = re.compile(r"\*\*|__")
+_BLANK_LINES_RE = re.compile(r"\n\n+")
+_HEADER_RE = re.compile(r"\n#{1,6}[^\S\n]+")
+_INDENT_RE = re.compile(r"\n *[^\S\n ][^\S\n]*")  # indent containing tabs etc.
+_MULTISPACE_RE = re.compile(r" (?<=[^ \n] ) +")  # 2+ spaces not at line start
+_JOIN_RE = re.compile(r"\n(?! |[-*][^\S\n])")  # newline not before indent/list
+
+
+# Whitespace controls that the fonts draw as a missing-glyph box. Each renders
+# as one space, so columns still match the one-cell-per-character layout
+_CONTROL_SPACES = "\t\x0b\x0c\r"
+_CONTROL_SPACES_TABLE = str.maketrans(_CONTROL_SPACES, " " * len(_CONTROL_SPACES))
+
+
+def _blank_control_spaces(text: str) -> str:
+    """Normalize CRLF line endings to LF and replace other whitespace controls with spaces."""
+    if "\r" in text:
+        text = text.replace("\r\n", "\n")
+    if any(ch in text for ch in _CONTROL_SPACES):
+        text = text.translate(_CONTROL_SPACES_TABLE)
+    return text
+
+
+def _indent_as_spaces(match: re.Match) -> str:
+    """Rewrite a line's leading whitespace as the same number of spaces."""
+    return "\n" + " " * (len(match.group()) - 1)
+
+
+def _minify_text(text: str) -> str:
+    """Uncached body of ``PixelPrompt.minify_text``."""
+    # Every pass runs over the whole text in C. Remove bold/italic markers,
+    # then strip trailing whitespace per line (map keeps the loop in C)
+    text = "\n".join(map(str.rstrip, _BOLD_RE.sub("", text).split("\n")))
+
+    # Bracket with newlines so every line starts after a "\n"; the
+    # line-start patterns below can then anchor on a literal newline
+    text = "\n" + text + "\n"
+    text = _BLANK_LINES_RE.sub("\n", text)  # Remove blank lines
+    text = _HEADER_RE.sub("\n", text)  # Remove header prefixes (keep the text)
+    text = _INDENT_RE.sub(_indent_as_spaces, text)  # Leading tabs -> spaces
+    text = _MULTISPACE_RE.sub(" ", text)  # Collapse spaces after the indent
+    text = text[1:-1]
+
+    # Join lines: preserve newlines only before list items (- or *
+    # followed by whitespace) and indented lines (preserves structure).
+    # Everything else becomes continuous text for optimal word-wrap.
+    return _JOIN_RE.sub(" ", text)
+
+
+_minify_text_cached = functools.lru_cache(maxsize=_MEMO_ENTRIES)(_minify_text)
+
+
+@dataclass(frozen=True)
 class RenderConfig:
-    """Configuration for text rendering to images."""
+    """Configuration for text rendering to images.
+
+    Frozen: PixelPrompt derives its font, metrics and canvas settings from the
+    config once at construction, so use ``dataclasses.replace`` to vary one.
+    """
 
     font_size: int = 9
     """Font size in points (range: 6-20). Default: 9 (optimal for Opus 4.6)."""
@@ -113,6 +228,17 @@ class RenderConfig:
     (code, config files).
     """
 
+    png_compress_level: int = 1
+    """zlib compression level (0-9) for PNG encoding. Default: 1.
+
+    The PNG is decoded by the LLM API, so encode speed matters more than a
+    few percent of file size. Applies to ``png_bytes()`` and ``save()``;
+    raise it when saving images for storage.
+    """
+
+    png_optimize: bool = False
+    """If True, run Pillow's extra PNG optimization pass (slow). Default: False."""
+
     content_type: Optional[str] = None
     """Content type preset: 'prose', 'json', 'code', 'config', or None.
 
@@ -121,6 +247,7 @@ class RenderConfig:
     """
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def for_content(content_type: str) -> "RenderConfig":
         """Create a RenderConfig with optimal settings for a content type.
 
@@ -128,7 +255,8 @@ class RenderConfig:
             content_type: One of 'prose', 'json', 'code', 'config'.
 
         Returns:
-            RenderConfig with optimal font_size and minify settings.
+            RenderConfig with optimal font_size and minify settings. Configs
+            are immutable, so each content type resolves to one shared instance.
 
         Raises:
             ValueError: If content_type is not recognized.
@@ -157,40 +285,30 @@ class RenderConfig:
         return self.max_height
 
 
-def estimate_image_tokens(width: int, height: int) -> int:
-    """Estimate Claude token cost for an image based on dimensions.
-
-    Uses official Anthropic formula: tokens = (width * height) / 750
-    Images larger than 1568px on longest side are scaled down first.
-
-    Args:
-        width: Image width in pixels.
-        height: Image height in pixels.
-
-    Returns:
-        Estimated token count.
-    """
-    scale = 1.0
-    if max(width, height) > MAX_VISION_DIMENSION:
-        scale = MAX_VISION_DIMENSION / max(width, height)
-
-    scaled_w = int(width * scale)
-    scaled_h = int(height * scale)
-
-    return max(1, int((scaled_w * scaled_h) / TOKENS_PER_PIXEL_DIVISOR))
-
-
 class RenderedImage:
     """Represents a single rendered image with token cost metadata."""
 
-    def __init__(self, image: Image.Image, token_cost: Optional[int] = None):
+    def __init__(
+        self,
+        image: Image.Image,
+        token_cost: Optional[int] = None,
+        *,
+        png_compress_level: int = 1,
+        png_optimize: bool = False,
+    ):
         """Initialize with PIL Image.
 
         Args:
             image: PIL Image object.
             token_cost: Pre-computed token cost. If None, computed from dimensions.
+            png_compress_level: zlib compression level (0-9) for PNG encoding.
+            png_optimize: If True, run Pillow's extra PNG optimization pass.
         """
         self._image = image
+        self._png_compress_level = png_compress_level
+        self._png_optimize = png_optimize
+        self._png_cache: Optional[bytes] = None
+        self._base64_cache: Optional[str] = None
         self._token_cost = (
             token_cost
             if token_cost is not None
@@ -218,14 +336,23 @@ class RenderedImage:
         return len(self.png_bytes())
 
     def png_bytes(self) -> bytes:
-        """Get raw PNG bytes."""
-        buffer = io.BytesIO()
-        self._image.save(buffer, format="PNG", optimize=True)
-        return buffer.getvalue()
+        """Get raw PNG bytes (encoded once, then cached)."""
+        if self._png_cache is None:
+            buffer = io.BytesIO()
+            self._image.save(
+                buffer,
+                format="PNG",
+                optimize=self._png_optimize,
+                compress_level=self._png_compress_level,
+            )
+            self._png_cache = buffer.getvalue()
+        return self._png_cache
 
     def base64(self) -> str:
-        """Get base64-encoded PNG for API integration."""
-        return base64.b64encode(self.png_bytes()).decode("utf-8")
+        """Get base64-encoded PNG for API integration (cached)."""
+        if self._base64_cache is None:
+            self._base64_cache = base64.b64encode(self.png_bytes()).decode("ascii")
+        return self._base64_cache
 
     def to_content_block(self) -> dict:
         """Convert to Anthropic API content block format.
@@ -242,9 +369,148 @@ class RenderedImage:
             },
         }
 
-    def save(self, path: str) -> None:
-        """Save image to file."""
-        self._image.save(path, format="PNG", optimize=True)
+    def save(self, path: Union[str, "os.PathLike[str]", BinaryIO]) -> None:
+        """Save image to a file path or binary file object.
+
+        Uses the same PNG settings as ``png_bytes``. If the PNG has already
+        been encoded, the cached bytes are written as-is instead of
+        encoding again.
+        """
+        if self._png_cache is not None:
+            if hasattr(path, "write"):
+                path.write(self._png_cache)
+            else:
+                with open(path, "wb") as f:
+                    f.write(self._png_cache)
+        else:
+            self._image.save(
+                path,
+                format="PNG",
+                optimize=self._png_optimize,
+                compress_level=self._png_compress_level,
+            )
+
+
+def _find_font(font_names: List[str], font_size: int) -> ImageFont.FreeTypeFont:
+    """
+    Find an available TrueType font from the list.
+
+    Prefers Menlo (optimal per Pixels Beat Tokens research).
+    """
+    # Common font paths on different systems
+    font_paths = [
+        # macOS — Menlo preferred (per paper)
+        "/System/Library/Fonts/Menlo.ttc",
+        "/System/Library/Fonts/Monaco.ttf",
+        "/System/Library/Fonts/SFMono-Regular.otf",
+        "/System/Library/Fonts/Supplemental/Courier New.ttf",
+        # Linux
+        "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationMono-Regular.ttf",
+        # Windows
+        "/Windows/Fonts/cour.ttf",
+        "/Windows/Fonts/consola.ttf",
+    ]
+
+    for path in font_paths:
+        try:
+            return ImageFont.truetype(path, font_size)
+        except (OSError, IOError):
+            continue
+
+    # Fallback to default font
+    return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=32)
+def _load_truetype(font_family: str, font_size: int) -> ImageFont.FreeTypeFont:
+    """Load the font for a family and size, cached across PixelPrompt instances."""
+    font_names = {
+        "monospace": ["Menlo", "DejaVuSansMono", "Courier New", "Liberation Mono"],
+        "sans-serif": ["DejaVuSans", "Arial", "Liberation Sans"],
+        "serif": ["DejaVuSerif", "Times New Roman", "Liberation Serif"],
+    }
+
+    family_fonts = font_names.get(font_family, font_names["monospace"])
+    return _find_font(family_fonts, font_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _measure_char(font_family: str, font_size: int) -> Tuple[int, int]:
+    """Measure character dimensions for a cached font (see ``_load_truetype``)."""
+    bbox = _load_truetype(font_family, font_size).getbbox("M")
+    return bbox[2] - bbox[0], bbox[3] - bbox[1]
+
+
+@functools.lru_cache(maxsize=32)
+def _build_glyph_table(
+    font_family: str, font_size: int
+) -> Tuple[int, Dict[str, Tuple[Any, int, int]], int, int]:
+    """Pre-rasterize printable ASCII glyphs (32-126) as greyscale masks.
+
+    Blitting a cached mask per character at a fixed advance matches
+    ``draw.text`` output on monospace fonts, without re-running FreeType
+    for every line. Fonts without a uniform integer advance get
+    an empty cache, and rendering falls back to ``draw.text``.
+
+    Masks are stored as ``(core image, width, height)`` so that they can
+    be handed straight to the C paste routine. Cached per family and size,
+    so the glyph set is rasterized once per process rather than per instance.
+
+    Returns:
+        Tuple of (advance, glyph cache, line mask height, overhang), where
+        overhang is how far the widest glyph extends past its advance.
+    """
+    font = _load_truetype(font_family, font_size)
+    chars = [chr(code) for code in range(32, 127)]
+    advances = {font.getlength(ch) for ch in chars}
+    if len(advances) != 1:
+        return 0, {}, 0, 0
+    advance = advances.pop()
+    if advance <= 0 or advance != int(advance):
+        return 0, {}, 0, 0
+
+    cache = {}
+    for ch in chars:
+        left, top, right, bottom = font.getbbox(ch)
+        if left < 0 or top < 0:
+            return 0, {}, 0, 0
+        mask = Image.new("L", (max(1, right), max(1, bottom)), 0)
+        ImageDraw.Draw(mask).text((0, 0), ch, fill=255, font=font)
+        cache[ch] = (mask.im, mask.width, mask.height)
+
+    advance = int(advance)
+    height = max(h for _, _, h in cache.values())
+    overhang = max([w - advance for _, w, _ in cache.values()] + [0])
+    return advance, cache, height, overhang
+
+
+@functools.lru_cache(maxsize=256)
+def _line_mask(font_family: str, font_size: int, line: str) -> Tuple[Any, int, int]:
+    """Compose a printable-ASCII line from cached glyphs into one mask.
+
+    The mask holds coverage only, so it is independent of the configured
+    colors. Cached per font and line across all instances, so repeated lines
+    (logs, code, boilerplate) are composed once. A full-width mask is about
+    15 KB at the default size and 37 KB at 20pt, so the cache stays under
+    10 MB per process, and instances hold no per-instance mask cache.
+
+    Returns:
+        Tuple of (core "L" image, width, height), like a glyph cache entry.
+    """
+    if not line.strip(" "):
+        return None, 0, 0
+    advance, glyphs, height, overhang = _build_glyph_table(font_family, font_size)
+    width = len(line) * advance + overhang
+    strip = Image.core.fill("L", (width, height), 0)
+    paste = strip.paste
+    x = 0
+    for ch in line:
+        if ch != " ":
+            mask, w, h = glyphs[ch]
+            paste(255, (x, 0, x + w, h), mask)
+        x += advance
+    return strip, width, height
 
 
 class PixelPrompt:
@@ -275,6 +541,13 @@ class PixelPrompt:
         self._validate_config()
         self._load_fonts()
         self._char_width, self._char_height = self._measure_char()
+        # Canvas mode and colors: greyscale ("L", 1 byte/pixel) when both colors
+        # are grey, which is a third of the canvas memory and PNG input of RGB
+        bg, fg = self.config.background_color, self.config.text_color
+        if bg[0] == bg[1] == bg[2] and fg[0] == fg[1] == fg[2]:
+            self._mode, self._bg, self._fg = "L", bg[0], fg[0]
+        else:
+            self._mode, self._bg, self._fg = "RGB", bg, fg
         self._line_height = self._char_height + self.config.line_spacing
         self._max_chars_per_line = max(
             1, (self.config.max_width - 2 * self.config.padding) // max(1, self._char_width)
@@ -282,6 +555,16 @@ class PixelPrompt:
         self._max_lines_per_image = max(
             1, (self.config.max_height - 2 * self.config.padding) // max(1, self._line_height)
         )
+        # Greedy word wrap: the longest run of up to max_chars_per_line ending in
+        # anything but a plain space, followed by spaces (dropped) or end of line;
+        # words longer than a line are force-split. Only plain spaces at a break
+        # are ever dropped, so a tail ending in e.g. NBSP or a tab is kept. Runs in
+        # the C regex engine instead of a per-word loop.
+        self._wrap_re = re.compile(
+            r"(.{{0,{}}}[^ ])(?: +|$)|(.{{{}}})".format(
+                self._max_chars_per_line - 1, self._max_chars_per_line
+            )
+        )
 
     def _validate_config(self) -> None:
         """Validate configuration values."""
@@ -295,54 +578,26 @@ class PixelPrompt:
             raise ValueError("padding must be non-negative")
         if self.config.line_spacing < 0:
             raise ValueError("line_spacing must be non-negative")
+        if not 0 <= self.config.png_compress_level <= 9:
+            raise ValueError("png_compress_level must be between 0 and 9")
 
     def _load_fonts(self) -> None:
-        """Load available fonts for the system."""
-        font_names = {
-            "monospace": ["Menlo", "DejaVuSansMono", "Courier New", "Liberation Mono"],
-            "sans-serif": ["DejaVuSans", "Arial", "Liberation Sans"],
-            "serif": ["DejaVuSerif", "Times New Roman", "Liberation Serif"],
-        }
+        """Load available fonts for the system (cached per family and size)."""
+        self._font = _load_truetype(self.config.font_family, self.config.font_size)
 
-        family_fonts = font_names.get(self.config.font_family, font_names["monospace"])
-        self._font = self._find_font(family_fonts)
+    def _measure_char(self) -> Tuple[int, int]:
+        """Measure character dimensions for the loaded monospace font."""
+        return _measure_char(self.config.font_family, self.config.font_size)
 
-    def _find_font(self, font_names: List[str]) -> ImageFont.FreeTypeFont:
-        """
-        Find an available TrueType font from the list.
+    @functools.cached_property
+    def _glyph_table(self) -> Tuple[int, Dict[str, Tuple[Any, int, int]], int, int]:
+        """Glyph masks and line-mask geometry, looked up on first use.
 
-        Prefers Menlo (optimal per Pixels Beat Tokens research).
+        Deferred so that instances used only for wrapping, splitting or
+        minification never rasterize the glyph set. The table itself is
+        shared by every instance with the same font (see ``_build_glyph_table``).
         """
-        # Common font paths on different systems
-        font_paths = [
-            # macOS — Menlo preferred (per paper)
-            "/System/Library/Fonts/Menlo.ttc",
-            "/System/Library/Fonts/Monaco.ttf",
-            "/System/Library/Fonts/SFMono-Regular.otf",
-            "/System/Library/Fonts/Supplemental/Courier New.ttf",
-            # Linux
-            "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationMono-Regular.ttf",
-            # Windows
-            "/Windows/Fonts/cour.ttf",
-            "/Windows/Fonts/consola.ttf",
-        ]
-
-        for path in font_paths:
-            try:
-                return ImageFont.truetype(path, self.config.font_size)
-            except (OSError, IOError):
-                continue
-
-        # Fallback to default font
-        return ImageFont.load_default()
-
-    def _measure_char(self) -> Tuple[int, int]:
-        """Measure character dimensions for the loaded monospace font."""
-        test_img = Image.new("RGB", (200, 200))
-        test_draw = ImageDraw.Draw(test_img)
-        bbox = test_draw.textbbox((0, 0), "M", font=self._font)
-        return bbox[2] - bbox[0], bbox[3] - bbox[1]
+        return _build_glyph_table(self.config.font_family, self.config.font_size)
 
     @staticmethod
     def compact_json(text: str) -> str:
@@ -350,6 +605,9 @@ class PixelPrompt:
 
         Parses the JSON and re-serializes with minimal formatting.
         Falls back to regex-based compaction if JSON parsing fails.
+        ASCII input with no removable whitespace is returned unchanged
+        without being parsed (so not canonicalized). Results for inputs
+        under 64K characters are memoized; larger payloads are not retained.
 
         Args:
             text: JSON string (pretty-printed or compact).
@@ -357,14 +615,11 @@ class PixelPrompt:
         Returns:
             Compact JSON string with no extra whitespace.
         """
-        try:
-            parsed = json.loads(text)
-            return json.dumps(parsed, separators=(",", ":"))
-        except (json.JSONDecodeError, ValueError):
-            # Fallback: regex-based compaction
-            result = re.sub(r"\s+", " ", text)
-            result = re.sub(r"\s*([{}:,\[\]])\s*", r"\1", result)
-            return result.strip()
+        if _is_compact_json(text):
+            return text
+        if len(text) < _MEMO_MAX_CHARS:
+            return _compact_json_cached(text)
+        return _compact_json(text)
 
     @staticmethod
     def minify_text(text: str) -> str:
@@ -380,7 +635,9 @@ class PixelPrompt:
         Line breaks are only preserved before list items (lines starting
         with ``-`` or ``*`` followed by space) and indented content.
         Everything else flows as continuous text — the renderer's word-wrap
-        handles line breaking at the optimal width.
+        handles line breaking at the optimal width. Results for inputs under
+        64K characters are memoized, so a system prompt rendered on every
+        request is only minified once; larger documents are not retained.
 
         Args:
             text: Raw text, potentially with markdown formatting.
@@ -388,40 +645,11 @@ class PixelPrompt:
         Returns:
             Minified text optimized for dense image rendering.
         """
-        lines = text.split("\n")
-        cleaned = []
-        for line in lines:
-            stripped = line.rstrip()
-            if not stripped:
-                continue  # Remove blank lines
-            # Remove markdown header prefixes (keep the text)
-            stripped = re.sub(r"^#{1,6}\s+", "", stripped)
-            # Remove bold/italic markers
-            stripped = stripped.replace("**", "").replace("__", "")
-            # Collapse multiple spaces (but preserve leading indent)
-            leading = len(stripped) - len(stripped.lstrip())
-            content = re.sub(r"  +", " ", stripped.lstrip())
-            stripped = " " * leading + content
-            cleaned.append(stripped)
-
-        # Join lines: preserve newlines only before list items and indented lines.
-        # Everything else becomes continuous text for optimal word-wrap.
-        if not cleaned:
-            return ""
-
-        result_parts = [cleaned[0]]
-        for line in cleaned[1:]:
-            # Preserve line break before list items (- or * followed by space)
-            # and indented content (preserves structure)
-            if re.match(r"^\s*[-*]\s", line) or line[0:1] == " ":
-                result_parts.append("\n" + line)
-            else:
-                # Join with space — word-wrap handles the rest
-                result_parts.append(" " + line)
+        if len(text) < _MEMO_MAX_CHARS:
+            return _minify_text_cached(text)
+        return _minify_text(text)
 
-        return "".join(result_parts)
-
-    def render(self, text: str) -> List[RenderedImage]:
+    def render(self, text: str, max_workers: Optional[int] = None) -> List[RenderedImage]:
         """
         Render text to one or more optimized PNG images.
 
@@ -432,6 +660,11 @@ class PixelPrompt:
 
         Args:
             text: Text content to render.
+            max_workers: If greater than 1, PNG-encode finished pages on a
+                thread pool of this size while later pages are drawn
+                (zlib releases the GIL). ``png_bytes()``/``base64()`` are
+                then already cached on the returned images. Default: None
+                (encode lazily on first use).
 
         Returns:
             List of RenderedImage objects with token cost metadata.
@@ -439,6 +672,52 @@ class PixelPrompt:
         Raises:
             ValueError: If text is empty.
         """
+        if max_workers is None or max_workers <= 1:
+            return list(self.iter_render(text))
+
+        images = []
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            encodes = []
+            for image in self.iter_render(text):
+                images.append(image)
+                encodes.append(pool.submit(image.png_bytes))
+            for encode in encodes:
+                encode.result()
+        return images
+
+    def iter_render(self, text: str) -> Iterator[RenderedImage]:
+        """
+        Render text lazily, one image at a time.
+
+        Same output as ``render()``, but each page is rasterized only when
+        the iterator reaches it, so callers can upload or save images as
+        they are produced without holding all of them in memory.
+        Input validation and word wrapping happen eagerly.
+
+        Args:
+            text: Text content to render.
+
+        Returns:
+            Iterator of RenderedImage objects with token cost metadata.
+
+        Raises:
+            ValueError: If text is empty.
+        """
+        wrapped_lines = self._layout(text)
+
+        # Paginate into (start, end) bounds that fit one image each, and
+        # render each page with dynamic sizing as it is requested
+        return (
+            self._render_page(wrapped_lines[start:end])
+            for start, end in self._paginate(wrapped_lines)
+        )
+
+    def _layout(self, text: str) -> List[str]:
+        """Validate, compact and word-wrap text into the lines to be rendered.
+
+        Raises:
+            ValueError: If text is empty, or empty after minification.
+        """
         if not text or not text.strip():
             raise ValueError("Text cannot be empty")
 
@@ -450,16 +729,9 @@ class PixelPrompt:
             if not text.strip():
                 raise ValueError("Text is empty after minification")
 
-        # Word-wrap text into lines
-        wrapped_lines = self._wrap_text(text)
-
-        # Paginate into groups that fit one image each
-        pages = self._paginate(wrapped_lines)
-
-        # Render each page with dynamic sizing
-        images = [self._render_page(page) for page in pages]
-
-        return images
+        # Word-wrap text into lines, with tabs and other whitespace controls
+        # blanked so those lines take the cached line-mask path
+        return self._wrap_text(_blank_control_spaces(text))
 
     def _wrap_text(self, text: str) -> List[str]:
         """
@@ -469,87 +741,88 @@ class PixelPrompt:
         """
         wrapped = []
         for paragraph in text.split("\n"):
-            if not paragraph:
-                wrapped.append("")
-                continue
-
             # Check if line fits as-is
             if len(paragraph) <= self._max_chars_per_line:
                 wrapped.append(paragraph)
                 continue
 
-            # Word-wrap long lines
-            words = paragraph.split(" ")
-            current_line = ""
-            for word in words:
-                test_line = "{} {}".format(current_line, word).strip() if current_line else word
-                if len(test_line) <= self._max_chars_per_line:
-                    current_line = test_line
-                else:
-                    if current_line:
-                        wrapped.append(current_line)
-                    # Handle words longer than max width
-                    while len(word) > self._max_chars_per_line:
-                        wrapped.append(word[: self._max_chars_per_line])
-                        word = word[self._max_chars_per_line :]
-                    current_line = word
-            if current_line:
-                wrapped.append(current_line)
+            # Word-wrap long lines in a single regex pass (see __init__)
+            wrapped.extend(fit or forced for fit, forced in self._wrap_re.findall(paragraph))
 
         return wrapped
 
-    def _paginate(self, lines: List[str]) -> List[List[str]]:
-        """Split wrapped lines into pages that fit on a single image."""
-        pages = []
-        for i in range(0, len(lines), self._max_lines_per_image):
-            page = lines[i : i + self._max_lines_per_image]
-            pages.append(page)
+    def _paginate(self, lines: List[str]) -> List[Tuple[int, int]]:
+        """Split wrapped lines into (start, end) bounds that fit on a single image."""
+        step = self._max_lines_per_image
+        bounds = [(i, min(i + step, len(lines))) for i in range(0, len(lines), step)]
+        return bounds if bounds else [(0, 0)]
 
-        return pages if pages else [lines]
-
-    def _render_page(self, lines: List[str]) -> RenderedImage:
-        """
-        Render a page of lines with dynamic dimensions.
+    def _page_size(self, lines: List[str]) -> Tuple[int, int]:
+        """Return the (width, height) of the image a page of lines renders to.
 
         Width and height are fitted to content when dynamic_width/height
         are enabled, minimizing token cost.
         """
-        # Calculate dimensions
-        if self.config.dynamic_width:
-            longest_line = max((len(line) for line in lines), default=0)
-            content_width = longest_line * self._char_width + 2 * self.config.padding
-            img_width = min(self.config.max_width, max(content_width, 50))
+        config = self.config
+        if config.dynamic_width:
+            longest_line = max(map(len, lines), default=0)
+            content_width = longest_line * self._char_width + 2 * config.padding
+            img_width = min(config.max_width, max(content_width, 50))
         else:
-            img_width = self.config.max_width
+            img_width = config.max_width
 
-        if self.config.dynamic_height:
-            content_height = len(lines) * self._line_height + 2 * self.config.padding
-            img_height = min(self.config.max_height, max(content_height, 20))
+        if config.dynamic_height:
+            content_height = len(lines) * self._line_height + 2 * config.padding
+            img_height = min(config.max_height, max(content_height, 20))
         else:
-            img_height = self.config.max_height
+            img_height = config.max_height
 
-        # Create image
-        image = Image.new("RGB", (img_width, img_height), self.config.background_color)
-        draw = ImageDraw.Draw(image)
+        return img_width, img_height
 
-        # Draw text
-        y = self.config.padding
+    def _render_page(self, lines: List[str]) -> RenderedImage:
+        """Render a page of lines at the size given by ``_page_size``."""
+        config = self.config
+        padding = config.padding
+        line_height = self._line_height
+        img_width, img_height = self._page_size(lines)
+
+        fg = self._fg
+        image = Image.new(self._mode, (img_width, img_height), self._bg)
+        draw = None
+
+        # Draw text: blit cached line masks, fall back to draw.text for
+        # lines with characters outside printable ASCII. The core paste skips
+        # Image.paste's per-call argument handling (ImageDraw uses it the same way).
+        # Everything the loop touches is bound to a local first.
+        paste = image.im.paste
+        use_masks = bool(self._glyph_table[1])
+        family, size = config.font_family, config.font_size
+        y = padding
         for line in lines:
-            draw.text(
-                (self.config.padding, y),
-                line,
-                fill=self.config.text_color,
-                font=self._font,
-            )
-            y += self._line_height
+            if use_masks and line.isascii() and line.isprintable():
+                mask, w, h = _line_mask(family, size, line)
+                if mask is not None:
+                    paste(fg, (padding, y, padding + w, y + h), mask)
+            else:
+                if draw is None:
+                    draw = ImageDraw.Draw(image)
+                draw.text((padding, y), line, fill=fg, font=self._font)
+            y += line_height
 
         token_cost = estimate_image_tokens(img_width, img_height)
-        return RenderedImage(image, token_cost=token_cost)
+        return RenderedImage(
+            image,
+            token_cost=token_cost,
+            png_compress_level=config.png_compress_level,
+            png_optimize=config.png_optimize,
+        )
 
     def compare(self, text: str, model: str = "claude-opus-4-6") -> Dict:
         """Compare text vs image token costs for the given content.
 
-        Renders the text and calculates estimated savings.
+        Lays the text out exactly as ``render()`` would and calculates
+        estimated savings from the resulting page sizes, without
+        rasterizing or encoding any images.
 
         Args:
             text: Text content to analyze.
@@ -559,33 +832,31 @@ class PixelPrompt:
             Dict with text_tokens, image_tokens, input_savings_pct,
             estimated_net_savings_pct, text_cost_usd, image_cost_usd.
         """
-        images = self.render(text)
+        lines = self._layout(text)
+        sizes = [self._page_size(lines[start:end]) for start, end in self._paginate(lines)]
         text_tokens = max(1, len(text) // 4)  # ~4 chars/token estimate
-        image_tokens = sum(img.tokens for img in images)
+        image_tokens = sum(estimate_image_tokens(w, h) for w, h in sizes)
 
-        # Look up pricing
-        pricing = None
-        for key, p in MODEL_PRICING.items():
-            if key in model:
-                pricing = p
-                break
-        if pricing is None:
-            pricing = MODEL_PRICING["claude-opus-4-6"]
+        # Look up pricing: exact model name first, then substring match for
+        # dated IDs (e.g. "claude-opus-4-6-20250219"), falling back to Opus
+        pricing = MODEL_PRICING.get(model) or next(
+            (p for key, p in MODEL_PRICING.items() if key in model),
+            MODEL_PRICING["claude-opus-4-6"],
+        )
+        rate = pricing["input"] / 1_000_000
 
-        input_savings = (text_tokens - image_tokens) / text_tokens if text_tokens > 0 else 0
+        input_savings = (text_tokens - image_tokens) / text_tokens  # text_tokens >= 1
 
         # Estimate net savings (assumes optimized prompts, ~equal output tokens)
         # Based on benchmark v2: output inflation is ~0% with good prompts
-        text_cost = text_tokens * pricing["input"] / 1_000_000
-        image_cost = image_tokens * pricing["input"] / 1_000_000
+        text_cost = text_tokens * rate
+        image_cost = image_tokens * rate
 
         return {
             "text_tokens": text_tokens,
             "image_tokens": image_tokens,
-            "num_images": len(images),
-            "image_dimensions": [
-                {"width": img.width, "height": img.height} for img in images
-            ],
+            "num_images": len(sizes),
+            "image_dimensions": [{"width": w, "height": h} for w, h in sizes],
             "input_savings_pct": round(input_savings * 100, 1),
             "text_cost_per_call": round(text_cost, 8),
             "image_cost_per_call": round(image_cost, 8),
@@ -600,9 +871,16 @@ class PixelPrompt:
 
         Deprecated: use render() directly. Kept for backwards compatibility.
         """
+        # Short text that cannot need wrapping or a second page is returned
+        # as-is: no line can be longer than all of its non-newline characters
+        newlines = text.count("\n")
+        if (
+            newlines < self._max_lines_per_image
+            and len(text) - newlines <= self._max_chars_per_line
+        ):
+            return [text]
         wrapped = self._wrap_text(text)
-        pages = self._paginate(wrapped)
-        return ["\n".join(page) for page in pages]
+        return ["\n".join(wrapped[start:end]) for start, end in self._paginate(wrapped)]
 
     def _render_chunk(self, text: str) -> RenderedImage:
         """
@@ -612,3 +890,38 @@ class PixelPrompt:
         """
         lines = text.split("\n")
         return self._render_page(lines)
+
+
+# ═══════════════════════════════════════════════════════════
+# Preset shortcuts (shared, lazily built instance per preset)
+# ═══════════════════════════════════════════════════════════
+
+
+@functools.lru_cache(maxsize=None)
+def _preset_instance(content_type: str) -> PixelPrompt:
+    """Return the shared PixelPrompt for a content-type preset.
+
+    Built on first use, then reused so repeated calls skip config
+    validation, font lookup and glyph rasterization.
+    """
+    return PixelPrompt(RenderConfig.for_content(content_type))
+
+
+def render_prose(text: str) -> List[RenderedImage]:
+    """Render text with the 'prose' preset. See ``PixelPrompt.render``."""
+    return _preset_instance("prose").render(text)
+
+
+def render_json(text: str) -> List[RenderedImage]:
+    """Render text with the 'json' preset. See ``PixelPrompt.render``."""
+    return _preset_instance("json").render(text)
+
+
+def render_code(text: str) -> List[RenderedImage]:
+    """Render text with the 'code' preset. See ``PixelPrompt.render``."""
+    return _preset_instance("code").render(text)
+
+
+def render_config(text: str) -> List[RenderedImage]:
+    """Render text with the 'config' preset. See ``PixelPrompt.render``."""
+    return _preset_instance("config").render(text)
@@ -9,7 +9,7 @@ savings. With optimized prompts, output inflation drops to ~0%.
 These helpers provide prompt wrappers that suppress verbosity.
 """
 
-from typing import Optional
+from typing import Dict, Optional
 
 # ═══════════════════════════════════════════════════════════
 # Prompt optimization constants (from benchmark v2)
@@ -24,6 +24,13 @@ CONCISE_SUFFIX = "Answer with ONLY the answer value. No explanation, no preamble
 EXTRACT_SUFFIX = "Extract and return ONLY the requested value. Nothing else."
 STRUCTURED_SUFFIX = "Return ONLY the result in the requested format. No commentary."
 
+_SUFFIXES: Dict[str, Optional[str]] = {
+    "concise": CONCISE_SUFFIX,
+    "extract": EXTRACT_SUFFIX,
+    "structured": STRUCTURED_SUFFIX,
+    "none": None,
+}
+
 
 def optimize_prompt(prompt: str, style: str = "concise") -> str:
     """Add output-suppression suffix to a prompt for image-mode queries.
@@ -47,26 +54,20 @@ def optimize_prompt(prompt: str, style: str = "concise") -> str:
         >>> optimize_prompt("What is the main function's return type?")  # doctest: +SKIP
         "What is the main function's return type? Answer with ONLY the answer value. ..."
     """
-    if style == "none":
+    suffix = _SUFFIXES.get(style, CONCISE_SUFFIX)
+    if suffix is None:
         return prompt
 
-    suffixes = {
-        "concise": CONCISE_SUFFIX,
-        "extract": EXTRACT_SUFFIX,
-        "structured": STRUCTURED_SUFFIX,
-    }
-
-    suffix = suffixes.get(style, CONCISE_SUFFIX)
-
-    # Don't double-add if already present
-    if suffix in prompt:
+    # Don't double-add if already present (the suffix is only ever appended,
+    # so checking the end avoids scanning a long prompt)
+    stripped = prompt.rstrip()
+    if stripped.endswith(suffix):
         return prompt
 
     # Add suffix with proper spacing
-    prompt = prompt.rstrip()
-    if not prompt.endswith((".", "?", "!", ":")):
-        prompt += "."
-    return "{} {}".format(prompt, suffix)
+    if not stripped.endswith((".", "?", "!", ":")):
+        stripped += "."
+    return "{} {}".format(stripped, suffix)
 
 
 def image_query(
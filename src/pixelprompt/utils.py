@@ -2,7 +2,12 @@
 Utility functions for PixelPrompt.
 """
 
-from .core import estimate_image_tokens
+import functools
+from typing import Iterable, List
+
+# Claude vision token formula (from Anthropic docs, Feb 2026)
+TOKENS_PER_PIXEL_DIVISOR = 750
+MAX_VISION_DIMENSION = 1568
 
 
 def estimate_tokens(text: str, model: str = "claude-opus-4-6-20250219") -> int:
@@ -27,6 +32,45 @@ def estimate_tokens(text: str, model: str = "claude-opus-4-6-20250219") -> int:
     return max(1, len(text) // 4)
 
 
+def estimate_tokens_batch(texts: Iterable[str]) -> List[int]:
+    """
+    Estimate token counts for many texts at once.
+
+    Same approximation as ``estimate_tokens``, computed in one
+    comprehension so large batches avoid a function call per text.
+
+    Args:
+        texts: Iterable of text strings.
+
+    Returns:
+        List of estimated token counts, in input order.
+    """
+    return [max(1, len(text) // 4) if text else 0 for text in texts]
+
+
+@functools.lru_cache(maxsize=4096)
+def estimate_image_tokens(width: int, height: int) -> int:
+    """Estimate Claude token cost for an image based on dimensions.
+
+    Uses official Anthropic formula: tokens = (width * height) / 750
+    Images larger than 1568px on longest side are scaled down first.
+
+    Args:
+        width: Image width in pixels.
+        height: Image height in pixels.
+
+    Returns:
+        Estimated token count.
+    """
+    longest = max(width, height)
+    if longest <= MAX_VISION_DIMENSION:
+        # Common case: no scaling, pure integer arithmetic
+        return max(1, (width * height) // TOKENS_PER_PIXEL_DIVISOR)
+
+    scale = MAX_VISION_DIMENSION / longest
+    return max(1, (int(width * scale) * int(height * scale)) // TOKENS_PER_PIXEL_DIVISOR)
+
+
 def estimate_compression_ratio(
     original_text: str,
     num_images: int,
@@ -0,0 +1,48 @@
+"""Shared fixtures for the PixelPrompt test suite."""
+
+import pytest
+
+from pixelprompt import PixelPrompt, RenderConfig
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="also run tests marked slow"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: render-heavy test, skipped unless --runslow")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test, use --runslow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def pxl():
+    """Default PixelPrompt, shared by every test that only reads from it."""
+    return PixelPrompt()
+
+
+@pytest.fixture(scope="session")
+def pxl_raw():
+    """PixelPrompt with minify=False (newlines and formatting preserved)."""
+    return PixelPrompt(RenderConfig(minify=False))
+
+
+@pytest.fixture(scope="session")
+def pxl_static():
+    """PixelPrompt with dynamic sizing off (always max_width x max_height).
+
+    Uses a 256x256 page: the static-sizing tests only compare dimensions,
+    so a full 1568x1568 canvas would just be extra allocation and encoding.
+    """
+    return PixelPrompt(
+        RenderConfig(dynamic_width=False, dynamic_height=False, max_width=256, max_height=256)
+    )
@@ -0,0 +1,36 @@
+"""Timing benchmarks for the text hot paths (run with pytest-benchmark installed)."""
+
+import pytest
+
+from pixelprompt.core import _minify_text
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.slow
+
+WRAP_TEXT = (" ".join(["word"] * 2000) + "\n") * 20
+
+SYSTEM_PROMPT = """## Credential Vault
+
+You have access to an encrypted credential vault for storing API keys and tokens.
+
+### Tools
+- `vault_get(service, key)` — Retrieve a decrypted credential
+- `vault_set(service, key, value)` — Store a credential (encrypted at rest)
+
+### Security Rules
+- NEVER include **credential values** in your text responses.
+- NEVER write credentials to files on disk.
+""" * 50
+
+
+def test_wrap_speed(benchmark, pxl):
+    """Greedy wrap of ~200 KB of long paragraphs."""
+    lines = benchmark.pedantic(pxl._wrap_text, args=(WRAP_TEXT,), rounds=50, warmup_rounds=5)
+    assert all(len(line) <= pxl._max_chars_per_line for line in lines)
+
+
+def test_minify_speed(benchmark):
+    """minify_text on a realistic markdown system prompt (bypassing its cache)."""
+    result = benchmark.pedantic(_minify_text, args=(SYSTEM_PROMPT,), rounds=50, warmup_rounds=5)
+    assert "**" not in result
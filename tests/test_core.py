@@ -1,25 +1,30 @@
 """Tests for PixelPrompt core functionality."""
 
 import base64
+import dataclasses
+import io
 
 import pytest
 
-from pixelprompt import PixelPrompt, RenderConfig, RenderedImage, estimate_image_tokens
+from pixelprompt import PixelPrompt, RenderConfig, RenderedImage, core, estimate_image_tokens
 from pixelprompt.core import RenderedImage as RenderedImageClass
 
+# Expected (w * h) / 750 token costs, computed once
+TOKENS_750 = 750
+TOKENS_1568 = int(1568 * 1568 / 750)
+TOKENS_200x100 = int(200 * 100 / 750)
+
 
 class TestEstimateImageTokens:
     """Test the image token estimation function."""
 
-    def test_basic_formula(self):
+    @pytest.mark.parametrize(
+        "width,height,expected",
+        [(750, 750, TOKENS_750), (1568, 1568, TOKENS_1568), (200, 100, TOKENS_200x100)],
+    )
+    def test_basic_formula(self, width, height, expected):
         """Token cost = (w * h) / 750."""
-        assert estimate_image_tokens(750, 750) == 750
-        assert estimate_image_tokens(1568, 1568) == int(1568 * 1568 / 750)
-
-    def test_small_image(self):
-        """Small images should have low token cost."""
-        tokens = estimate_image_tokens(200, 100)
-        assert tokens == int(200 * 100 / 750)
+        assert estimate_image_tokens(width, height) == expected
 
     def test_dynamic_width_savings(self):
         """Dynamic width images should cost much less than full-size."""
@@ -71,19 +76,33 @@ class TestRenderConfig:
         assert config.width == 1024
         assert config.height == 512
 
+    def test_png_encoding_defaults(self):
+        """PNG encoding should default to fast settings."""
+        config = RenderConfig()
+        assert config.png_compress_level == 1
+        assert config.png_optimize is False
+
     def test_static_sizing(self):
         """Test disabling dynamic sizing."""
         config = RenderConfig(dynamic_width=False, dynamic_height=False)
         assert config.dynamic_width is False
         assert config.dynamic_height is False
 
+    def test_config_is_frozen(self):
+        """Configs should be immutable and hashable; replace() derives new ones."""
+        config = RenderConfig()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.font_size = 12
+        larger = dataclasses.replace(config, font_size=12)
+        assert larger.font_size == 12 and config.font_size == 9
+        assert hash(config) == hash(RenderConfig())
+
 
 class TestPixelPrompt:
     """Test PixelPrompt main class."""
 
-    def test_initialization(self):
+    def test_initialization(self, pxl):
         """Test PixelPrompt initialization."""
-        pxl = PixelPrompt()
         assert pxl.config.font_size == 9
         assert pxl.config.max_width == 1568
 
@@ -93,92 +112,123 @@ class TestPixelPrompt:
         pxl = PixelPrompt(config=config)
         assert pxl.config.font_size == 12
 
-    def test_char_measurement(self):
+    def test_char_measurement(self, pxl):
         """Test character dimensions are measured."""
-        pxl = PixelPrompt()
         assert pxl._char_width > 0
         assert pxl._char_height > 0
 
-    def test_max_chars_per_line(self):
+    def test_max_chars_per_line(self, pxl):
         """Test max chars calculation is reasonable."""
-        pxl = PixelPrompt()
         assert pxl._max_chars_per_line > 50
         assert pxl._max_chars_per_line < 500
 
-    def test_invalid_font_size(self):
-        """Test that invalid font size raises error."""
-        config = RenderConfig(font_size=25)
-        with pytest.raises(ValueError, match="font_size must be between 6 and 20"):
+    def test_invalid_png_compress_level(self):
+        """Test that out-of-range PNG compression level raises error."""
+        config = RenderConfig(png_compress_level=10)
+        with pytest.raises(ValueError, match="png_compress_level must be between 0 and 9"):
             PixelPrompt(config=config)
 
-    def test_invalid_font_family(self):
-        """Test that invalid font family raises error."""
-        config = RenderConfig(font_family="invalid")
-        with pytest.raises(ValueError, match="font_family must be"):
-            PixelPrompt(config=config)
+    @pytest.mark.parametrize(
+        "kwargs,match",
+        [
+            ({"font_size": 25}, "font_size must be between 6 and 20"),
+            ({"font_family": "invalid"}, "font_family must be"),
+        ],
+    )
+    def test_invalid_font_config(self, kwargs, match, monkeypatch):
+        """Test that invalid font settings raise before any font is loaded."""
+
+        def fail_load(self):
+            raise AssertionError("fonts loaded before validation")
 
-    def test_render_simple_text(self):
+        monkeypatch.setattr(PixelPrompt, "_load_fonts", fail_load)
+        with pytest.raises(ValueError, match=match):
+            PixelPrompt(config=RenderConfig(**kwargs))
+
+    def test_render_simple_text(self, pxl):
         """Test rendering simple text."""
-        pxl = PixelPrompt()
         images = pxl.render("Hello, World!")
         assert len(images) == 1
         assert isinstance(images[0], RenderedImageClass)
 
-    def test_render_multiline_text(self):
+    def test_render_multiline_text(self, pxl):
         """Test rendering multiline text."""
-        pxl = PixelPrompt()
         text = "Line 1\nLine 2\nLine 3"
         images = pxl.render(text)
         assert len(images) >= 1
 
-    def test_render_empty_text_raises_error(self):
+    def test_render_empty_text_raises_error(self, pxl):
         """Test that empty text raises error."""
-        pxl = PixelPrompt()
         with pytest.raises(ValueError, match="Text cannot be empty"):
             pxl.render("")
 
-    def test_render_whitespace_text_raises_error(self):
+    def test_render_whitespace_text_raises_error(self, pxl):
         """Test that whitespace-only text raises error."""
-        pxl = PixelPrompt()
         with pytest.raises(ValueError, match="Text cannot be empty"):
             pxl.render("   \n  ")
 
-    def test_render_long_text_splits(self):
+    def test_render_control_whitespace_as_spaces(self, pxl_raw):
+        """Tabs, CRLF and other whitespace controls should render like spaces."""
+        controls = pxl_raw.render("\tx = 1\r\ny\x0c= 2\r")[0]
+        spaces = pxl_raw.render(" x = 1\ny = 2 ")[0]
+        assert controls.png_bytes() == spaces.png_bytes()
+
+    @pytest.mark.slow
+    def test_render_long_text_splits(self, pxl_raw):
         """Test that long text is split into multiple images."""
         # Use minify=False so newlines are preserved and paginate into multiple pages.
         # With minify=True, lines get joined and may fit on a single wide image.
-        pxl = PixelPrompt(RenderConfig(minify=False))
-        text = "\n".join(["Line {}".format(i) for i in range(1000)])
-        images = pxl.render(text)
+        # A few lines more than one page holds is enough to force a split.
+        rows = pxl_raw._max_lines_per_image
+        text = "\n".join(["Line {}".format(i) for i in range(rows + 5)])
+        images = pxl_raw.render(text)
         assert len(images) > 1
 
+    @pytest.mark.slow
+    def test_iter_render_matches_render(self, pxl_raw):
+        """iter_render should yield the same pages as render."""
+        text = "\n".join(["Line {}".format(i) for i in range(pxl_raw._max_lines_per_image + 5)])
+        streamed = pxl_raw.iter_render(text)
+        assert not isinstance(streamed, list)
+        dims = [(img.width, img.height, img.tokens) for img in streamed]
+        assert dims == [(img.width, img.height, img.tokens) for img in pxl_raw.render(text)]
+
+    @pytest.mark.slow
+    def test_render_with_workers_pre_encodes(self, pxl_raw):
+        """max_workers should return the same pages with PNGs already encoded."""
+        text = "\n".join(["Line {}".format(i) for i in range(pxl_raw._max_lines_per_image + 5)])
+        serial = pxl_raw.render(text)
+        pooled = pxl_raw.render(text, max_workers=2)
+        assert all(img._png_cache is not None for img in pooled)
+        assert [img.png_bytes() for img in pooled] == [img.png_bytes() for img in serial]
+
+    def test_iter_render_validates_eagerly(self, pxl):
+        """iter_render should raise on empty text before iteration starts."""
+        with pytest.raises(ValueError, match="Text cannot be empty"):
+            pxl.iter_render("   ")
+
 
 class TestDynamicSizing:
     """Test dynamic image sizing."""
 
-    def test_narrow_content_narrow_image(self):
+    def test_narrow_content_narrow_image(self, pxl):
         """Short lines should produce narrow images."""
-        pxl = PixelPrompt()
         images = pxl.render("Hi")
         img = images[0]
         assert img.width < 1568
         assert img.width < 200  # "Hi" is very short
 
-    def test_short_content_short_image(self):
+    def test_short_content_short_image(self, pxl):
         """Few lines should produce short images."""
-        pxl = PixelPrompt()
         images = pxl.render("Hello\nWorld")
         img = images[0]
         assert img.height < 1568
         assert img.height < 100  # Just 2 lines
 
-    def test_dynamic_saves_tokens(self):
+    def test_dynamic_saves_tokens(self, pxl, pxl_static):
         """Dynamic sizing should use fewer tokens than static."""
-        pxl_dynamic = PixelPrompt()
-        pxl_static = PixelPrompt(RenderConfig(dynamic_width=False, dynamic_height=False))
-
         text = "Short text\nJust two lines"
-        imgs_dynamic = pxl_dynamic.render(text)
+        imgs_dynamic = pxl.render(text)
         imgs_static = pxl_static.render(text)
 
         dynamic_tokens = sum(img.tokens for img in imgs_dynamic)
@@ -188,75 +238,73 @@ class TestDynamicSizing:
         # Should be dramatically less
         assert dynamic_tokens < static_tokens / 10
 
-    def test_static_sizing_uses_full_dimensions(self):
+    def test_static_sizing_uses_full_dimensions(self, pxl_static):
         """Static sizing should use full width/height."""
-        pxl = PixelPrompt(RenderConfig(dynamic_width=False, dynamic_height=False))
-        images = pxl.render("Tiny text")
+        images = pxl_static.render("Tiny text")
         img = images[0]
-        assert img.width == 1568
-        assert img.height == 1568
+        assert img.width == pxl_static.config.max_width == 256
+        assert img.height == pxl_static.config.max_height == 256
 
-    def test_long_line_wraps_and_fits(self):
+    def test_long_line_wraps_and_fits(self, pxl):
         """Long lines should be wrapped within max_width."""
-        pxl = PixelPrompt()
-        long_text = " ".join(["word"] * 200)
+        # Just past one line's worth of words, so the text must wrap
+        n_words = pxl._max_chars_per_line // len("word ") + 10
+        long_text = " ".join(["word"] * n_words)
         images = pxl.render(long_text)
-        for img in images:
-            assert img.width <= 1568
+        assert max(img.width for img in images) <= 1568
+
+
+@pytest.fixture(scope="class")
+def img(pxl):
+    """One rendered "Test" image shared by the TestRenderedImage export tests."""
+    return pxl.render("Test")[0]
 
 
 class TestRenderedImage:
     """Test RenderedImage class."""
 
-    def test_rendered_image_dynamic_size(self):
+    def test_rendered_image_dynamic_size(self, img):
         """Test RenderedImage has dynamic size (not always 1568x1568)."""
-        pxl = PixelPrompt()
-        images = pxl.render("Test")
-        img = images[0]
-
         # With dynamic sizing, a single word should be much smaller
         assert img.width < 1568
         assert img.height < 1568
 
-    def test_token_cost_property(self):
+    def test_token_cost_property(self, img):
         """Test tokens property reflects actual dimensions."""
-        pxl = PixelPrompt()
-        images = pxl.render("Test")
-        img = images[0]
-
         expected = estimate_image_tokens(img.width, img.height)
         assert img.tokens == expected
 
-    def test_token_cost_scales_with_size(self):
+    def test_token_cost_scales_with_size(self, pxl):
         """Larger images should cost more tokens."""
-        pxl = PixelPrompt()
-
         small_imgs = pxl.render("Hi")
-        large_imgs = pxl.render("\n".join(["A longer line of text here"] * 50))
+        large_imgs = pxl.render("\n".join(["A longer line of text here"] * 3))
 
         small_tokens = small_imgs[0].tokens
         large_tokens = sum(img.tokens for img in large_imgs)
 
         assert large_tokens > small_tokens
 
-    def test_png_bytes(self):
+    def test_png_bytes(self, img):
         """Test PNG bytes export."""
-        pxl = PixelPrompt()
-        images = pxl.render("Test")
-        img = images[0]
-
         png_bytes = img.png_bytes()
         assert isinstance(png_bytes, bytes)
         assert len(png_bytes) > 0
         # PNG signature
         assert png_bytes[:8] == b"\x89PNG\r\n\x1a\n"
 
-    def test_base64(self):
-        """Test base64 encoding."""
-        pxl = PixelPrompt()
-        images = pxl.render("Test")
-        img = images[0]
+    def test_greyscale_colors_render_in_l_mode(self, img):
+        """Grey-on-grey configs should render single-channel images."""
+        assert img._image.mode == "L"
+        colored = PixelPrompt(RenderConfig(text_color=(200, 0, 0))).render("Test")[0]
+        assert colored._image.mode == "RGB"
 
+    def test_png_bytes_cached(self, img):
+        """PNG bytes should only be encoded once per image."""
+        assert img.png_bytes() is img.png_bytes()
+        assert img.size_bytes == len(img.png_bytes())
+
+    def test_base64(self, img):
+        """Test base64 encoding."""
         base64_str = img.base64()
         assert isinstance(base64_str, str)
         assert len(base64_str) > 0
@@ -266,22 +314,32 @@ class TestRenderedImage:
         except Exception as e:
             pytest.fail("Invalid base64: {}".format(e))
 
-    def test_to_content_block(self):
+    def test_base64_cached(self, img):
+        """Repeated base64 and content block calls should reuse one encoding."""
+        b64 = img.base64()
+        assert img.base64() is b64
+        assert img.to_content_block()["source"]["data"] is b64
+
+    def test_to_content_block(self, img):
         """Test Anthropic API content block format."""
-        pxl = PixelPrompt()
-        images = pxl.render("Test")
-        block = images[0].to_content_block()
+        block = img.to_content_block()
 
         assert block["type"] == "image"
         assert block["source"]["type"] == "base64"
         assert block["source"]["media_type"] == "image/png"
         assert isinstance(block["source"]["data"], str)
 
-    def test_save_image(self, tmp_path):
-        """Test saving image to file."""
-        pxl = PixelPrompt()
-        images = pxl.render("Test")
-        img = images[0]
+    def test_save_image(self, img):
+        """Test saving image to an in-memory file object."""
+        buffer = io.BytesIO()
+        img.save(buffer)
+
+        assert buffer.tell() > 0
+        assert buffer.getvalue()[:8] == b"\x89PNG\r\n\x1a\n"
+
+    def test_save_image_path(self, pxl, tmp_path):
+        """Test saving a freshly rendered image to a filesystem path."""
+        img = pxl.render("Test")[0]
 
         output_path = tmp_path / "test.png"
         img.save(str(output_path))
@@ -289,58 +347,176 @@ class TestRenderedImage:
         assert output_path.exists()
         assert output_path.stat().st_size > 0
 
+    def test_save_matches_png_bytes(self, pxl, tmp_path):
+        """save() should write the same PNG as png_bytes(), before or after encoding."""
+        img = pxl.render("Test")[0]
+        fresh_path = tmp_path / "fresh.png"
+        img.save(str(fresh_path))
+        data = img.png_bytes()
+        cached_path = tmp_path / "cached.png"
+        img.save(str(cached_path))
+        assert fresh_path.read_bytes() == data == cached_path.read_bytes()
+
 
 class TestWordWrapping:
     """Test word wrapping functionality."""
 
-    def test_short_lines_unchanged(self):
+    def test_short_lines_unchanged(self, pxl):
         """Short lines should pass through unchanged."""
-        pxl = PixelPrompt()
         lines = pxl._wrap_text("Hello World\nFoo Bar")
         assert lines == ["Hello World", "Foo Bar"]
 
-    def test_empty_lines_preserved(self):
+    def test_empty_lines_preserved(self, pxl):
         """Empty lines should be preserved."""
-        pxl = PixelPrompt()
         lines = pxl._wrap_text("Hello\n\nWorld")
         assert lines == ["Hello", "", "World"]
 
-    def test_long_lines_wrapped(self):
+    def test_long_lines_wrapped(self, pxl):
         """Lines longer than max width should be word-wrapped."""
-        pxl = PixelPrompt()
         long_line = " ".join(["word"] * 200)
         lines = pxl._wrap_text(long_line)
         assert len(lines) > 1
         for line in lines:
             assert len(line) <= pxl._max_chars_per_line
 
-    def test_very_long_word_split(self):
+    def test_wrap_breaks_at_spaces(self, pxl):
+        """Wrapped lines should break between words and drop the break space."""
+        words = ["alpha", "beta", "gamma", "delta"] * 100
+        lines = pxl._wrap_text(" ".join(words))
+        assert " ".join(lines).split(" ") == words
+        for line in lines:
+            assert not line.startswith(" ") and not line.endswith(" ")
+
+    def test_very_long_word_split(self, pxl):
         """Words longer than max width should be force-split."""
-        pxl = PixelPrompt()
         long_word = "x" * (pxl._max_chars_per_line + 50)
         lines = pxl._wrap_text(long_word)
         assert len(lines) >= 2
         for line in lines:
             assert len(line) <= pxl._max_chars_per_line
 
+    @pytest.mark.parametrize("end", ["\u00a0", "\t", "\r"])
+    def test_wrap_keeps_tail_ending_in_other_whitespace(self, pxl, end):
+        """A short last piece ending in non-space whitespace should not be dropped."""
+        text = "word " * 100 + "tail" + end
+        lines = pxl._wrap_text(text)
+        assert " ".join(lines).split() == text.split()
+        assert lines[-1].endswith("tail" + end)
+
+
+class TestGlyphCache:
+    """Test cached glyph blitting."""
+
+    def test_cache_covers_printable_ascii(self, pxl):
+        """Every printable ASCII character should have a cached mask."""
+        advance, glyphs = pxl._glyph_table[:2]
+        if not glyphs:
+            pytest.skip("Loaded font has no uniform advance")
+        assert set(glyphs) == {chr(c) for c in range(32, 127)}
+        assert advance > 0
+
+    def test_built_on_first_render(self):
+        """Glyphs should not be rasterized until something is rendered."""
+        pxl = PixelPrompt()
+        pxl._split_text("not rendered yet")
+        assert "_glyph_table" not in vars(pxl)
+        pxl.render("now rendered")
+        assert "_glyph_table" in vars(pxl)
+
+    def test_shared_across_instances(self):
+        """Instances with the same font should reuse one glyph table."""
+        first = PixelPrompt(RenderConfig(font_size=11))
+        second = PixelPrompt(RenderConfig(font_size=11, minify=False))
+        assert first._glyph_table is second._glyph_table
+
+    def test_matches_draw_text(self, pxl_raw):
+        """Blitted glyphs should match a plain draw.text rendering."""
+        from PIL import Image, ImageChops, ImageDraw
+
+        lines = ["def render(self, text: str) -> List[str]:", "    return [gjpqy(x) for x in {}]"]
+        img = pxl_raw._render_page(lines)
+
+        expected = Image.new("RGB", (img.width, img.height), pxl_raw.config.background_color)
+        draw = ImageDraw.Draw(expected)
+        y = pxl_raw.config.padding
+        for line in lines:
+            draw.text(
+                (pxl_raw.config.padding, y),
+                line,
+                fill=pxl_raw.config.text_color,
+                font=pxl_raw._font,
+            )
+            y += pxl_raw._line_height
+
+        assert ImageChops.difference(img._image.convert("RGB"), expected).getbbox() is None
+
+    def test_non_ascii_falls_back(self, pxl_raw):
+        """Lines with non-ASCII characters should still render."""
+        images = pxl_raw.render("caf\u00e9 na\u00efve\nplain ascii")
+        assert len(images) == 1
+
+    def test_repeated_lines_reuse_line_mask(self):
+        """Identical lines should be rasterized once and then served from cache."""
+        pxl = PixelPrompt(RenderConfig(minify=False))
+        if not pxl._glyph_table[1]:
+            pytest.skip("Loaded font has no uniform advance")
+        core._line_mask.cache_clear()
+        pxl.render("\n".join(["INFO request handled in 12ms"] * 40))
+        info = core._line_mask.cache_info()
+        assert info.misses == 1
+        assert info.hits == 39
+
 
 class TestSplitText:
     """Test text splitting functionality (backwards compat)."""
 
-    def test_split_short_text(self):
+    def test_split_short_text(self, pxl):
         """Test that short text is not split."""
-        pxl = PixelPrompt()
         text = "Short text"
         chunks = pxl._split_text(text)
         assert len(chunks) == 1
 
-    def test_split_respects_newlines(self):
+    def test_split_respects_newlines(self, pxl):
         """Test that text is split on newlines."""
-        pxl = PixelPrompt()
         text = "Line 1\nLine 2\nLine 3"
         chunks = pxl._split_text(text)
         assert len(chunks) >= 1
 
+    def test_split_short_text_returned_as_is(self, pxl):
+        """Text that fits one page without wrapping should not be rebuilt."""
+        text = "Line 1\nLine 2\nLine 3"
+        assert pxl._split_text(text)[0] is text
+
+    def test_split_still_wraps_long_line(self, pxl):
+        """A single line one char too long should still be wrapped."""
+        text = "x" * (pxl._max_chars_per_line + 1)
+        assert pxl._split_text(text) == ["x" * pxl._max_chars_per_line + "\nx"]
+
+
+# (input, expected minify_text output); non-list, non-indented lines are
+# joined with a space
+MINIFY_CASES = [
+    pytest.param("Hello\n\n\nWorld", "Hello World", id="removes_blank_lines"),
+    pytest.param(
+        "## Safety\nDon't do bad things", "Safety Don't do bad things", id="strips_headers"
+    ),
+    pytest.param(
+        "# H1\n## H2\n### H3\n#### H4\n##### H5\n###### H6",
+        "H1 H2 H3 H4 H5 H6",
+        id="strips_all_header_levels",
+    ),
+    pytest.param("This is **bold** text", "This is bold text", id="removes_bold_markers"),
+    pytest.param("This is __bold__ text", "This is bold text", id="removes_underscore_bold"),
+    pytest.param("Hello    World", "Hello World", id="collapses_multiple_spaces"),
+    pytest.param("Hello   \nWorld  ", "Hello World", id="strips_trailing_whitespace"),
+    pytest.param(
+        "First line.\nSecond line.\nThird line.",
+        "First line. Second line. Third line.",
+        id="joins_prose_lines",
+    ),
+    pytest.param("## Hello\n\nWorld", "Hello World", id="header_and_blank_line"),
+]
+
 
 class TestMinification:
     """Test text minification for image rendering."""
@@ -350,42 +526,10 @@ class TestMinification:
         config = RenderConfig()
         assert config.minify is True
 
-    def test_minify_removes_blank_lines(self):
-        """Blank lines should be removed."""
-        result = PixelPrompt.minify_text("Hello\n\n\nWorld")
-        # Non-list, non-indented lines are joined with space
-        assert result == "Hello World"
-
-    def test_minify_strips_markdown_headers(self):
-        """Markdown ## headers should have prefix removed."""
-        result = PixelPrompt.minify_text("## Safety\nDon't do bad things")
-        assert result == "Safety Don't do bad things"
-
-    def test_minify_strips_all_header_levels(self):
-        """All header levels (# through ######) should be stripped."""
-        result = PixelPrompt.minify_text("# H1\n## H2\n### H3\n#### H4\n##### H5\n###### H6")
-        assert result == "H1 H2 H3 H4 H5 H6"
-
-    def test_minify_removes_bold_markers(self):
-        """Bold ** markers should be removed."""
-        result = PixelPrompt.minify_text("This is **bold** text")
-        assert result == "This is bold text"
-
-    def test_minify_removes_underscore_bold(self):
-        """Bold __ markers should be removed."""
-        result = PixelPrompt.minify_text("This is __bold__ text")
-        assert result == "This is bold text"
-
-    def test_minify_collapses_multiple_spaces(self):
-        """Multiple spaces should collapse to one."""
-        result = PixelPrompt.minify_text("Hello    World")
-        assert result == "Hello World"
-
-    def test_minify_strips_trailing_whitespace(self):
-        """Trailing whitespace should be removed."""
-        result = PixelPrompt.minify_text("Hello   \nWorld  ")
-        # Joined into continuous text
-        assert result == "Hello World"
+    @pytest.mark.parametrize("text,expected", MINIFY_CASES)
+    def test_minify(self, text, expected):
+        """minify_text should produce the expected compact text."""
+        assert PixelPrompt.minify_text(text) == expected
 
     def test_minify_preserves_list_indent(self):
         """List item indentation should be preserved."""
@@ -398,11 +542,6 @@ class TestMinification:
         assert "\n- Item 1" in result
         assert "\n- Item 2" in result
 
-    def test_minify_joins_prose_lines(self):
-        """Non-list, non-indented consecutive lines should be joined."""
-        result = PixelPrompt.minify_text("First line.\nSecond line.\nThird line.")
-        assert result == "First line. Second line. Third line."
-
     def test_minify_preserves_content(self):
         """Semantic content should be fully preserved."""
         text = "## Config\n- key = value\n- port = 8080"
@@ -411,12 +550,6 @@ class TestMinification:
         assert "port = 8080" in result
         assert "Config" in result
 
-    def test_minify_static_method(self):
-        """minify_text should work as a static method."""
-        result = PixelPrompt.minify_text("## Hello\n\nWorld")
-        # Joined: "Hello World"
-        assert result == "Hello World"
-
     def test_minify_mixed_prose_and_lists(self):
         """Mix of prose and list items should be handled correctly."""
         text = "## Section\nSome intro text.\nMore text.\n- Item 1\n- Item 2\nConclusion here."
@@ -427,45 +560,41 @@ class TestMinification:
         assert "\n- Item 2" in result
         assert "Conclusion here." in result
 
-    def test_minify_reduces_image_height(self):
+    def test_minify_reduces_image_height(self, pxl, pxl_raw):
         """Minified text should produce shorter images (fewer blank lines)."""
         text = "## Section\n\nLine 1\n\nLine 2\n\nLine 3"
-        pxl_minify = PixelPrompt(RenderConfig(minify=True))
-        pxl_raw = PixelPrompt(RenderConfig(minify=False))
 
-        imgs_minify = pxl_minify.render(text)
+        imgs_minify = pxl.render(text)
         imgs_raw = pxl_raw.render(text)
 
         assert imgs_minify[0].height < imgs_raw[0].height
 
-    def test_minify_reduces_tokens(self):
+    @pytest.mark.slow
+    def test_minify_reduces_tokens(self, pxl, pxl_raw):
         """Minified rendering should use fewer tokens."""
         text = (
             "## Safety\n\nBe helpful.\n\n## Rules\n\n- Rule 1\n- Rule 2\n\n## Notes\n\nSome text."
         )
-        pxl_minify = PixelPrompt(RenderConfig(minify=True))
-        pxl_raw = PixelPrompt(RenderConfig(minify=False))
 
-        tokens_minify = sum(i.tokens for i in pxl_minify.render(text))
+        tokens_minify = sum(i.tokens for i in pxl.render(text))
         tokens_raw = sum(i.tokens for i in pxl_raw.render(text))
 
         assert tokens_minify < tokens_raw
 
-    def test_minify_false_preserves_formatting(self):
+    def test_minify_false_preserves_formatting(self, pxl_raw):
         """With minify=False, blank lines and headers should be preserved."""
-        pxl = PixelPrompt(RenderConfig(minify=False))
         text = "## Header\n\nParagraph"
-        images = pxl.render(text)
+        images = pxl_raw.render(text)
         # Should work (no crash), and preserve blank lines in height
         assert len(images) >= 1
 
-    def test_minify_only_blank_lines_raises(self):
+    def test_minify_only_blank_lines_raises(self, pxl):
         """Text that becomes empty after minification should raise error."""
-        pxl = PixelPrompt(RenderConfig(minify=True))
         with pytest.raises(ValueError, match="empty"):
             pxl.render("\n\n\n")
 
-    def test_minify_realistic_system_prompt(self):
+    @pytest.mark.slow
+    def test_minify_realistic_system_prompt(self, pxl, pxl_raw):
         """Test with realistic system prompt section."""
         section = """## Credential Vault
 
@@ -486,10 +615,8 @@ You have access to an encrypted credential vault for storing and retrieving API
 - NEVER include credential values in your text responses.
 - NEVER write credentials to files on disk.
 """
-        pxl_minify = PixelPrompt(RenderConfig(minify=True))
-        pxl_raw = PixelPrompt(RenderConfig(minify=False))
 
-        tokens_minify = sum(i.tokens for i in pxl_minify.render(section))
+        tokens_minify = sum(i.tokens for i in pxl.render(section))
         tokens_raw = sum(i.tokens for i in pxl_raw.render(section))
 
         # Minified should save at least 10%
@@ -502,3 +629,25 @@ You have access to an encrypted credential vault for storing and retrieving API
 
         result = minify_text("## Hello\n\nWorld")
         assert result == "Hello World"
+
+
+# (public function, its size-gated cache, a small input it rewrites)
+MEMO_CASES = [
+    (PixelPrompt.minify_text, core._minify_text_cached, "## Title\n\nBody  text"),
+    (PixelPrompt.compact_json, core._compact_json_cached, '{ "a" : [1, 2] }'),
+]
+
+
+class TestMemoCaches:
+    """Test the size gate on the module-level memo caches."""
+
+    @pytest.mark.parametrize("func,cached,small", MEMO_CASES)
+    def test_only_small_inputs_are_cached(self, func, cached, small):
+        """Small inputs should be served from the cache; large ones not retained."""
+        cached.cache_clear()
+        assert func(small) == func(small)
+        assert cached.cache_info().hits == 1
+
+        large = small + " " * core._MEMO_MAX_CHARS
+        assert func(large) == func(small)
+        assert cached.cache_info().currsize == 1
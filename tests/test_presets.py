@@ -12,6 +12,10 @@ from pixelprompt import (
     compact_json,
     image_query,
     optimize_prompt,
+    render_code,
+    render_config,
+    render_json,
+    render_prose,
 )
 from pixelprompt.prompts import CONCISE_SUFFIX, EXTRACT_SUFFIX, STRUCTURED_SUFFIX
 
@@ -85,6 +89,10 @@ class TestContentPresets:
         with pytest.raises(ValueError, match="Unknown content type"):
             RenderConfig.for_content("html")
 
+    def test_for_content_returns_shared_instance(self):
+        """Each content type should resolve to one cached config."""
+        assert RenderConfig.for_content("code") is RenderConfig.for_content("code")
+
     def test_for_content_creates_working_config(self):
         """Config from for_content should work with PixelPrompt."""
         for content_type in CONTENT_PRESETS:
@@ -94,6 +102,33 @@ class TestContentPresets:
             assert len(images) >= 1
 
 
+class TestPresetShortcuts:
+    """Test render_prose/render_json/render_code/render_config."""
+
+    @pytest.mark.parametrize(
+        "content_type,shortcut",
+        [
+            ("prose", render_prose),
+            ("json", render_json),
+            ("code", render_code),
+            ("config", render_config),
+        ],
+    )
+    def test_shortcut_matches_preset(self, content_type, shortcut):
+        """Shortcuts should render exactly like an explicit preset instance."""
+        text = '{"key": "value",\n  "items": [1, 2, 3]}\n## Notes\n\nSome text.'
+        expected = PixelPrompt(RenderConfig.for_content(content_type)).render(text)
+        images = shortcut(text)
+        assert [(i.width, i.height) for i in images] == [(i.width, i.height) for i in expected]
+        assert images[0].png_bytes() == expected[0].png_bytes()
+
+    def test_shortcut_reuses_instance(self):
+        """The preset instance should be built once and shared."""
+        from pixelprompt.core import _preset_instance
+
+        assert _preset_instance("prose") is _preset_instance("prose")
+
+
 # ═══════════════════════════════════════════════════════════
 # compact_json
 # ═══════════════════════════════════════════════════════════
@@ -114,6 +149,16 @@ class TestCompactJson:
         result = compact_json(compact)
         assert result == compact
 
+    def test_compact_input_returned_as_is(self):
+        """Already compact input should skip re-serialization entirely."""
+        compact = json.dumps([{"id": i, "name": "user %d" % i} for i in range(50)])
+        compact = compact.replace(", ", ",").replace(": ", ":")
+        assert compact_json(compact) is compact
+
+    def test_compact_non_ascii_still_serialized(self):
+        """Non-ASCII input should keep json.dumps escaping."""
+        assert compact_json('{"name":"caf\u00e9"}') == '{"name":"caf\\u00e9"}'
+
     def test_compact_nested_json(self):
         """Nested JSON should be fully compacted."""
         data = {"users": [{"name": "Alice", "age": 30}, {"name": "Bob", "age": 25}]}
@@ -159,9 +204,8 @@ class TestCompactJson:
 class TestCompare:
     """Test cost comparison functionality."""
 
-    def test_compare_returns_dict(self):
+    def test_compare_returns_dict(self, pxl):
         """compare() should return a dict with expected keys."""
-        pxl = PixelPrompt()
         result = pxl.compare("Hello world, this is a test of the comparison feature.")
         assert isinstance(result, dict)
         assert "text_tokens" in result
@@ -171,36 +215,55 @@ class TestCompare:
         assert "image_dimensions" in result
         assert "model" in result
 
-    def test_compare_shows_savings(self):
+    def test_compare_shows_savings(self, pxl):
         """Longer text should show positive input savings."""
         text = "Lorem ipsum dolor sit amet. " * 100
-        pxl = PixelPrompt()
         result = pxl.compare(text)
         assert result["input_savings_pct"] > 0
         assert result["text_tokens"] > result["image_tokens"]
 
-    def test_compare_with_different_models(self):
+    def test_compare_with_different_models(self, pxl):
         """compare() should accept different model names."""
-        pxl = PixelPrompt()
         text = "Test content for comparison."
         for model in MODEL_PRICING:
             result = pxl.compare(text, model=model)
             assert result["model"] == model
 
-    def test_compare_unknown_model_uses_opus(self):
+    def test_compare_unknown_model_uses_opus(self, pxl):
         """Unknown model should fall back to Opus pricing."""
-        pxl = PixelPrompt()
         result = pxl.compare("Test content.", model="unknown-model")
         assert result["model"] == "unknown-model"
         # Should still return valid results
         assert result["text_tokens"] > 0
 
-    def test_compare_image_dimensions_match(self):
+    def test_compare_dated_model_id_uses_base_pricing(self, pxl):
+        """Dated model IDs should resolve to their base model's pricing."""
+        text = "Test content for pricing."
+        base = pxl.compare(text, model="claude-haiku-4-5")
+        dated = pxl.compare(text, model="claude-haiku-4-5-20251001")
+        assert dated["text_cost_per_call"] == base["text_cost_per_call"]
+
+    def test_compare_image_dimensions_match(self, pxl):
         """Image dimensions in compare result should match num_images."""
-        pxl = PixelPrompt()
         result = pxl.compare("Test content for dimensions.")
         assert len(result["image_dimensions"]) == result["num_images"]
 
+    def test_compare_matches_render_without_rasterizing(self, pxl_raw, monkeypatch):
+        """compare() should report render()'s sizes and tokens from layout alone."""
+        text = "\n".join("Row {} of the report".format(i) for i in range(300))
+        images = pxl_raw.render(text)
+
+        def fail_render(self, lines):
+            raise AssertionError("compare() rasterized a page")
+
+        monkeypatch.setattr(PixelPrompt, "_render_page", fail_render)
+        result = pxl_raw.compare(text)
+        assert result["num_images"] == len(images) > 1
+        assert result["image_dimensions"] == [
+            {"width": img.width, "height": img.height} for img in images
+        ]
+        assert result["image_tokens"] == sum(img.tokens for img in images)
+
 
 # ═══════════════════════════════════════════════════════════
 # Prompt optimization
@@ -237,6 +300,11 @@ class TestOptimizePrompt:
         result = optimize_prompt(already)
         assert result.count(CONCISE_SUFFIX) == 1
 
+    def test_no_double_suffix_with_trailing_whitespace(self):
+        """A suffix followed only by whitespace should still count as present."""
+        already = "What? " + CONCISE_SUFFIX + "\n"
+        assert optimize_prompt(already) == already
+
     def test_adds_period_if_missing(self):
         """Should add period before suffix if prompt doesn't end with punctuation."""
         result = optimize_prompt("What is the port")
@@ -1,7 +1,8 @@
 """Tests for PixelPrompt utility functions."""
 
-from pixelprompt.utils import estimate_compression_ratio, estimate_tokens
+from pixelprompt import utils
 from pixelprompt.core import estimate_image_tokens
+from pixelprompt.utils import estimate_compression_ratio, estimate_tokens, estimate_tokens_batch
 
 
 class TestEstimateTokens:
@@ -28,6 +29,31 @@ class TestEstimateTokens:
         assert tokens >= 1
 
 
+class TestEstimateTokensBatch:
+    """Test batched token estimation."""
+
+    def test_matches_single_estimates(self):
+        """Batch results should equal per-text estimate_tokens."""
+        texts = ["", "a", "Hello", "a" * 100, "x" * 4001]
+        assert estimate_tokens_batch(texts) == [estimate_tokens(t) for t in texts]
+
+    def test_accepts_generator(self):
+        """Any iterable of strings should be accepted."""
+        assert estimate_tokens_batch("a" * n for n in (4, 8)) == [1, 2]
+
+    def test_empty_batch(self):
+        """An empty batch should return an empty list."""
+        assert estimate_tokens_batch([]) == []
+
+
+class TestEstimateImageTokens:
+    """Test the shared image token estimate."""
+
+    def test_core_reexports_utils_function(self):
+        """core and utils should expose the same estimate_image_tokens."""
+        assert estimate_image_tokens is utils.estimate_image_tokens
+
+
 class TestEstimateCompressionRatio:
     """Test compression ratio estimation."""
 